@@ -13,35 +13,117 @@ Requirements:
     - No external dependencies (uses only standard library)
 """
 
+import functools
 import os
+import re
+import string
+import types
 import datetime
 from pathlib import Path
 
+_UTC = datetime.timezone.utc
+
+# Default event built once at import; the read-only proxy keeps callers
+# from mutating shared state while still supporting the mapping API
+_DEFAULT_EVENT = {
+    'title': 'AI Engineer Summit 2025',
+    'start_date': datetime.datetime(2025, 11, 19, 9, 0),
+    'end_date': datetime.datetime(2025, 11, 22, 17, 0),
+    'location': 'New York, New York',
+    'description': (
+        'The premier technical AI summit for AI Engineers & AI Leaders who ship. '
+        'Invite-only, curated for top AI Engineers.\n\n'
+        'Website: https://apply.ai.engineer/\n'
+        'Application Deadline: September 15, 2025'
+    ),
+    'url': 'https://apply.ai.engineer/',
+    'organizer': 'AI Engineer Summit',
+    'categories': 'CONFERENCE,TECHNOLOGY,AI'
+}
+DEFAULT_EVENT = types.MappingProxyType(_DEFAULT_EVENT)
+
+# Delete table for filename slugs - strips everything outside [A-Za-z0-9 -]
+# in one C pass instead of a per-character isalnum() generator. Only valid
+# for ASCII titles; non-ASCII ones take the isalnum() path so accented
+# letters survive and curly quotes/dashes are still dropped.
+_SLUG_KEEP = frozenset(string.ascii_letters + string.digits + ' -')
+_SLUG_DELETE = str.maketrans('', '', ''.join(
+    chr(i) for i in range(256) if chr(i) not in _SLUG_KEEP))
+
+
+@functools.lru_cache(maxsize=256)
+def _fmt_dt(dt):
+    """Format a datetime for ICS (UTC), memoized for repeated timestamps"""
+    # Plain integer formatting avoids strftime's format-code dispatch
+    return f'{dt.year:04d}{dt.month:02d}{dt.day:02d}T{dt.hour:02d}{dt.minute:02d}{dt.second:02d}Z'
+
+# Month-name lookup shared by every _parse_date_string call
+_MONTHS = {
+    'jan': 1, 'january': 1, 'feb': 2, 'february': 2, 'mar': 3, 'march': 3,
+    'apr': 4, 'april': 4, 'may': 5, 'jun': 6, 'june': 6, 'jul': 7, 'july': 7,
+    'aug': 8, 'august': 8, 'sep': 9, 'september': 9, 'oct': 10, 'october': 10,
+    'nov': 11, 'november': 11, 'dec': 12, 'december': 12
+}
+
+# Translation table for ICS text escaping - one C-level pass instead of
+# chained str.replace() calls
+_ESCAPE_TABLE = str.maketrans({'\n': '\\n', ',': '\\,', ';': '\\;'})
+_ESCAPE_RE = re.compile(r'[\n,;]')
+
+# ICS skeleton rendered once at import time; only the variable fields are
+# substituted per event. One format_map over the whole template beats
+# assembling ~30 per-line f-strings and joining them, and the default-event
+# path avoids substitution entirely - don't split this back into line lists.
+_ICS_TEMPLATE = (
+    'BEGIN:VCALENDAR\r\n'
+    'VERSION:2.0\r\n'
+    'PRODID:-//AI Engineer Summit//Calendar Event Generator//EN\r\n'
+    'CALSCALE:GREGORIAN\r\n'
+    'METHOD:PUBLISH\r\n'
+    'BEGIN:VEVENT\r\n'
+    'UID:{uid}\r\n'
+    'DTSTART:{dtstart}\r\n'
+    'DTEND:{dtend}\r\n'
+    'DTSTAMP:{dtstamp}\r\n'
+    'SUMMARY:{summary}\r\n'
+    'LOCATION:{location}\r\n'
+    'DESCRIPTION:{description}\r\n'
+    'ORGANIZER:CN={organizer}\r\n'
+    'URL:{url}\r\n'
+    'STATUS:CONFIRMED\r\n'
+    'TRANSP:OPAQUE\r\n'
+    'CATEGORIES:{categories}\r\n'
+    'BEGIN:VALARM\r\n'
+    'TRIGGER:-P1D\r\n'
+    'ACTION:DISPLAY\r\n'
+    'DESCRIPTION:{title} starts tomorrow!\r\n'
+    'END:VALARM\r\n'
+    'BEGIN:VALARM\r\n'
+    'TRIGGER:-PT1H\r\n'
+    'ACTION:DISPLAY\r\n'
+    'DESCRIPTION:{title} starts in 1 hour!\r\n'
+    'END:VALARM\r\n'
+    'END:VEVENT\r\n'
+    'END:VCALENDAR'
+)
+
 
 class AIEngineerCalendarGenerator:
     """Generate calendar events for AI Engineer events"""
-    
-    def __init__(self):
-        # Default event for backwards compatibility
-        self.default_event = {
-            'title': 'AI Engineer Summit 2025',
-            'start_date': datetime.datetime(2025, 11, 19, 9, 0),
-            'end_date': datetime.datetime(2025, 11, 22, 17, 0),
-            'location': 'New York, New York',
-            'description': (
-                'The premier technical AI summit for AI Engineers & AI Leaders who ship. '
-                'Invite-only, curated for top AI Engineers.\n\n'
-                'Website: https://apply.ai.engineer/\n'
-                'Application Deadline: September 15, 2025'
-            ),
-            'url': 'https://apply.ai.engineer/',
-            'organizer': 'AI Engineer Summit',
-            'categories': 'CONFERENCE,TECHNOLOGY,AI'
-        }
-    
+
+    # Date-parsing patterns compiled once instead of per _parse_date_string call
+    _DATE_PATTERNS = (
+        (re.compile(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d+)\s*[-–]\s*(\d+),?\s*(20\d{2})', re.IGNORECASE), 'MMM d-d, YYYY'),
+        (re.compile(r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d+)\s*[-–]\s*(\d+),?\s*(20\d{2})', re.IGNORECASE), 'MMMM d-d, YYYY'),
+        (re.compile(r'(\d{1,2})/(\d{1,2})/(20\d{2})'), 'M/d/YYYY'),
+    )
+
+    # Shared read-only default, kept as an attribute for backwards compatibility
+    default_event = DEFAULT_EVENT
+
     def _format_datetime(self, dt):
         """Format datetime for ICS format (UTC)"""
-        return dt.strftime('%Y%m%dT%H%M%SZ')
+        return _fmt_dt(dt)
     
     def _generate_uid(self):
         """Generate unique event ID"""
@@ -50,36 +132,22 @@ class AIEngineerCalendarGenerator:
     
     def _escape_text(self, text):
         """Escape special characters in ICS text fields"""
-        # Replace newlines with \n and escape special characters
-        return text.replace('\n', '\\n').replace(',', '\\,').replace(';', '\\;')
+        # Most titles/locations contain no metacharacters - return them as-is
+        if _ESCAPE_RE.search(text) is None:
+            return text
+        return text.translate(_ESCAPE_TABLE)
     
     def _parse_date_string(self, date_str):
         """Parse various date string formats to datetime objects"""
-        import re
-        
         if not date_str:
             return None, None
-        
-        # Try to extract date ranges
-        patterns = [
-            (r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d+)\s*[-–]\s*(\d+),?\s*(20\d{2})', 'MMM d-d, YYYY'),
-            (r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d+)\s*[-–]\s*(\d+),?\s*(20\d{2})', 'MMMM d-d, YYYY'),
-            (r'(\d{1,2})/(\d{1,2})/(20\d{2})', 'M/d/YYYY'),
-        ]
-        
-        months = {
-            'jan': 1, 'january': 1, 'feb': 2, 'february': 2, 'mar': 3, 'march': 3,
-            'apr': 4, 'april': 4, 'may': 5, 'jun': 6, 'june': 6, 'jul': 7, 'july': 7,
-            'aug': 8, 'august': 8, 'sep': 9, 'september': 9, 'oct': 10, 'october': 10,
-            'nov': 11, 'november': 11, 'dec': 12, 'december': 12
-        }
-        
-        for pattern, format_type in patterns:
-            match = re.search(pattern, date_str, re.IGNORECASE)
+
+        for pattern, format_type in self._DATE_PATTERNS:
+            match = pattern.search(date_str)
             if match:
                 if 'MMM' in format_type:
                     month_name = match.group(1).lower()
-                    month = months.get(month_name)
+                    month = _MONTHS.get(month_name)
                     start_day = int(match.group(2))
                     end_day = int(match.group(3))
                     year = int(match.group(4))
@@ -99,14 +167,24 @@ class AIEngineerCalendarGenerator:
         # Default fallback
         return None, None
     
-    def generate_ics_content(self, event_details=None):
-        """Generate the ICS file content for a single event"""
-        if event_details is None:
-            event_details = self.default_event
-        
-        uid = self._generate_uid()
-        now = datetime.datetime.utcnow()
-        dtstamp = self._format_datetime(now)
+    def generate_ics_content(self, event_details=None, uid=None, dtstamp=None):
+        """Generate the ICS file content for a single event
+
+        Batch callers can pass pre-computed uid/dtstamp values to skip the
+        per-event datetime round-trips.
+        """
+        if uid is None:
+            uid = self._generate_uid()
+        if dtstamp is None:
+            # DTSTAMP changes every call, so bypass the memoized formatter
+            now = datetime.datetime.now(_UTC)
+            dtstamp = f'{now.year:04d}{now.month:02d}{now.day:02d}T{now.hour:02d}{now.minute:02d}{now.second:02d}Z'
+
+        if event_details is None or event_details is self.default_event:
+            # Everything but UID/DTSTAMP is constant for the default event,
+            # so concatenate around the pre-rendered static segments
+            prefix, mid, suffix = self._default_render_parts()
+            return f'{prefix}{uid}{mid}{dtstamp}{suffix}'
         
         # Parse dates if they're strings
         start_date = event_details.get('start_date')
@@ -124,74 +202,85 @@ class AIEngineerCalendarGenerator:
         organizer = event_details.get('organizer', 'AI Engineer')
         categories = event_details.get('categories', 'CONFERENCE,TECHNOLOGY,AI')
         
-        ics_lines = [
-            'BEGIN:VCALENDAR',
-            'VERSION:2.0',
-            'PRODID:-//AI Engineer Summit//Calendar Event Generator//EN',
-            'CALSCALE:GREGORIAN',
-            'METHOD:PUBLISH',
-            'BEGIN:VEVENT',
-            f'UID:{uid}',
-            f'DTSTART:{self._format_datetime(start_date)}',
-            f'DTEND:{self._format_datetime(end_date)}',
-            f'DTSTAMP:{dtstamp}',
-            f'SUMMARY:{self._escape_text(title)}',
-            f'LOCATION:{self._escape_text(location)}',
-            f'DESCRIPTION:{self._escape_text(description)}',
-            f'ORGANIZER:CN={organizer}',
-            f'URL:{url}',
-            'STATUS:CONFIRMED',
-            'TRANSP:OPAQUE',
-            f'CATEGORIES:{categories}',
-            # Reminder 1 day before
-            'BEGIN:VALARM',
-            'TRIGGER:-P1D',
-            'ACTION:DISPLAY',
-            f'DESCRIPTION:{title} starts tomorrow!',
-            'END:VALARM',
-            # Reminder 1 hour before
-            'BEGIN:VALARM',
-            'TRIGGER:-PT1H',
-            'ACTION:DISPLAY',
-            f'DESCRIPTION:{title} starts in 1 hour!',
-            'END:VALARM',
-            'END:VEVENT',
-            'END:VCALENDAR'
-        ]
-        
-        return '\r\n'.join(ics_lines)
+        # Bind the helpers once instead of an attribute lookup per field
+        _fmt = self._format_datetime
+        _esc = self._escape_text
+
+        return _ICS_TEMPLATE.format_map({
+            'uid': uid,
+            'dtstart': _fmt(start_date),
+            'dtend': _fmt(end_date),
+            'dtstamp': dtstamp,
+            'summary': _esc(title),
+            'location': _esc(location),
+            'description': _esc(description),
+            'organizer': organizer,
+            'url': url,
+            'categories': categories,
+            'title': title,
+        })
     
-    def save_calendar_file(self, event_details=None, filename=None, output_dir=None):
+    # Cached (prefix, mid, suffix) of the default-event render, split at the
+    # UID and DTSTAMP fields - the only parts that vary between calls
+    _default_parts = None
+
+    @classmethod
+    def _default_render_parts(cls):
+        if cls._default_parts is None:
+            rendered = cls().generate_ics_content(
+                dict(_DEFAULT_EVENT), uid='\x00UID\x00', dtstamp='\x00STAMP\x00')
+            prefix, rest = rendered.split('\x00UID\x00')
+            mid, suffix = rest.split('\x00STAMP\x00')
+            cls._default_parts = (prefix, mid, suffix)
+        return cls._default_parts
+
+    def generate_ics_batch(self, events):
+        """Generate ICS content for a batch of events in one pass"""
+        # Bind the method once so the loop avoids per-event attribute lookups
+        generate = self.generate_ics_content
+        return [generate(event) for event in events]
+
+    def save_calendar_file(self, event_details=None, filename=None, output_dir=None, uid=None, dtstamp=None, verbose=True):
         """Save a single calendar event to an .ics file"""
-        if event_details is None:
-            event_details = self.default_event
-            
-        if filename is None:
-            safe_title = "".join(c for c in event_details.get('title', 'ai-engineer-event') if c.isalnum() or c in (' ', '-')).rstrip()
-            safe_title = safe_title.replace(' ', '-').lower()
-            filename = f'{safe_title}.ics'
-        
         if output_dir is None:
             output_dir = Path.cwd()
         else:
             output_dir = Path(output_dir)
-        
+
         # Ensure output directory exists
         output_dir.mkdir(parents=True, exist_ok=True)
-        
+
+        return self._save_single(event_details, filename, output_dir, uid=uid, dtstamp=dtstamp, verbose=verbose)
+
+    def _save_single(self, event_details, filename, output_dir, uid=None, dtstamp=None, verbose=True):
+        """Write one event's .ics file, assuming output_dir already exists"""
+        if event_details is None:
+            event_details = self.default_event
+
+        if filename is None:
+            title = event_details.get('title', 'ai-engineer-event')
+            if title.isascii():
+                safe_title = title.translate(_SLUG_DELETE).rstrip()
+            else:
+                safe_title = ''.join(c for c in title if c.isalnum() or c in (' ', '-')).rstrip()
+            safe_title = safe_title.replace(' ', '-').lower()
+            filename = f'{safe_title}.ics'
+
         filepath = output_dir / filename
-        
+
         try:
-            ics_content = self.generate_ics_content(event_details)
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(ics_content)
-            
-            print(f"✅ Calendar event saved successfully!")
-            print(f"📁 File location: {filepath.absolute()}")
-            print(f"📅 Event: {event_details.get('title', 'AI Engineer Event')}")
-            print(f"📍 Location: {event_details.get('location', 'Location TBD')}")
-            
+            # Encode once and write binary, skipping the TextIOWrapper layer
+            data = self.generate_ics_content(event_details, uid=uid, dtstamp=dtstamp).encode('utf-8')
+
+            with open(filepath, 'wb') as f:
+                f.write(data)
+
+            if verbose:
+                print(f"✅ Calendar event saved successfully!")
+                print(f"📁 File location: {filepath.absolute()}")
+                print(f"📅 Event: {event_details.get('title', 'AI Engineer Event')}")
+                print(f"📍 Location: {event_details.get('location', 'Location TBD')}")
+
             return filepath
             
         except Exception as e:
@@ -213,19 +302,30 @@ class AIEngineerCalendarGenerator:
         
         saved_files = []
         print(f"\n📅 Generating {len(events_list)} calendar files...")
-        
+
+        # One timestamp and UID base for the whole batch instead of a
+        # datetime round-trip per event
+        now = datetime.datetime.now(_UTC)
+        batch_dtstamp = f'{now.year:04d}{now.month:02d}{now.day:02d}T{now.hour:02d}{now.minute:02d}{now.second:02d}Z'
+        base_ts = int(now.timestamp())
+
         for i, event in enumerate(events_list, 1):
-            print(f"🔄 Processing event {i}/{len(events_list)}: {event.get('title', 'Untitled')}")
-            
-            filepath = self.save_calendar_file(
-                event_details=event,
-                output_dir=output_dir
+            # The batch directory was created above, so skip the per-event
+            # mkdir; per-event printing is suppressed in favor of the
+            # final summary below
+            filepath = self._save_single(
+                event,
+                None,
+                output_dir,
+                uid=f'ai-engineer-summit-2025-{base_ts}-{i}@ai.engineer',
+                dtstamp=batch_dtstamp,
+                verbose=False
             )
             
             if filepath:
                 saved_files.append(filepath)
         
-        print(f"\n🎉 Successfully generated {len(saved_files)} calendar files!")
+        print(f"\n🎉 Successfully generated {len(saved_files)} calendar files in {output_dir}!")
         print("\n💡 To add to your calendar:")
         print("   1. Open your calendar app (Google Calendar, Outlook, Apple Calendar, etc.)")
         print("   2. Import each .ics file")
@@ -237,11 +337,11 @@ class AIEngineerCalendarGenerator:
         """Display event details to the user"""
         print("🎯 AI Engineer Summit 2025 - Event Details")
         print("=" * 50)
-        print(f"📅 Event: {self.event_details['title']}")
-        print(f"📍 Location: {self.event_details['location']}")
-        print(f"🗓️  Dates: {self.event_details['start_date'].strftime('%B %d')} - {self.event_details['end_date'].strftime('%B %d, %Y')}")
-        print(f"🌐 Website: {self.event_details['url']}")
-        print(f"📝 Description: {self.event_details['description'][:100]}...")
+        print(f"📅 Event: {self.default_event['title']}")
+        print(f"📍 Location: {self.default_event['location']}")
+        print(f"🗓️  Dates: {self.default_event['start_date'].strftime('%B %d')} - {self.default_event['end_date'].strftime('%B %d, %Y')}")
+        print(f"🌐 Website: {self.default_event['url']}")
+        print(f"📝 Description: {self.default_event['description'][:100]}...")
         print("=" * 50)
 
 
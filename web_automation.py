@@ -14,7 +14,10 @@ Usage:
 """
 
 import asyncio
+import atexit
+import hashlib
 import os
+import re
 import sys
 from pathlib import Path
 from urllib.parse import urljoin
@@ -22,197 +25,597 @@ import json
 import time
 
 try:
-    from playwright.async_api import async_playwright
+    from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
     import requests
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, FeatureNotFound, Tag
 except ImportError as e:
     print(f"❌ Missing required dependencies: {e}")
     print("Please install with: pip install playwright beautifulsoup4 requests")
     print("Then run: playwright install")
     sys.exit(1)
 
+try:
+    # Optional: matches every known city name in one linear scan instead of
+    # backtracking through a 20+-way regex alternation per container
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    # Optional: C-level JSON serializer for the results file
+    import orjson
+except ImportError:
+    orjson = None
+
 from calendar_generator import AIEngineerCalendarGenerator
 
+# User agent applied to every browser context to appear more human-like
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+# Patterns used once per candidate container, compiled at import instead of
+# per call through re's internal cache
+_ANY_DATE_RE = re.compile(
+    r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|January|February|March|April|May|June|July|August|September|October|November|December)'
+    r'\s+\d+[\s\-–]*(\d+)?,?\s*20\d{2}', re.IGNORECASE)
+_YEAR_RE = re.compile(r'20\d{2}')
+_EVENT_KW_RE = re.compile(r'summit|conference|fair|workshop|meetup|hackathon')
+_TITLE_KW_RE = re.compile(r'summit|conference|fair|workshop|meetup|hackathon|aie paris')
+
+# Container-level indicators used by the discovery walk; one alternation
+# scan per container instead of a generator of substring tests
+_CONTAINER_TITLE_RE = re.compile(
+    r"aie paris|fall summit|world's fair|ai engineer summit|ai engineer world|paris 2025")
+_CONTAINER_KW_RE = re.compile(r'2025|2026|summit|conference|event|workshop|meetup|hackathon')
+
+# Non-event boilerplate (footers, signup blurbs, legal text); one compiled
+# alternation scans the text once instead of a substring walk per keyword
+_EXCLUDE_RE = re.compile('|'.join(map(re.escape, (
+    'newsletter', 'email', 'spam', 'subscribe', 'join our', 'terms of service',
+    'code of conduct', 'sponsor inquiry', 'scholarships', 'contact us',
+    'copyright', '©', 'software 3.0', 'valuable insights', 'exclusive content',
+    'special offers', 'event updates', 'find more talks', 'watch our',
+    'what is an ai engineer', 'workshops'
+))))
+
+# Containers whose whole text is just a date string are not events
+_DATE_ONLY_RES = [re.compile(p) for p in (
+    r'^(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d+[-–]\d+\s+20\d{2},?\s*[A-Za-z\s,]+$',
+    r'^(June|November|September)\s+\d+[-–](July\s+)?\d+\s+20\d{2},?\s*[A-Za-z\s,]+$'
+)]
+_MONTH_LINE_RE = re.compile(
+    r'^(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d+')
+
+# Date formats searched in container text and titles
+_DATE_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d+\s*[-–]\s*\d+,?\s*20\d{2}',
+    r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d+\s*[-–]\s*\d+,?\s*20\d{2}',
+    r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d+,?\s*20\d{2}',
+    r'(September|November|June)\s+\d+[-–]\d+,?\s*20\d{2}',
+    r'\d{1,2}/\d{1,2}/20\d{2}',
+    r'20\d{2}-\d{2}-\d{2}'
+)]
+
+# Known event dates, matched loosely and reported in canonical form
+_EVENT_DATE_PATTERNS = [(re.compile(p), std) for p, std in (
+    (r'september\s+23[-–]24.*2025', 'September 23-24, 2025'),
+    (r'november\s+20[-–]22.*2025', 'November 20-22, 2025'),
+    (r'june\s+30.*july\s+2.*2026', 'June 30-July 2, 2026'),
+    (r'march.*2025', 'March 2025')
+)]
+
+_KNOWN_CITIES = (
+    'New York', 'San Francisco', 'Los Angeles', 'Chicago', 'Boston', 'Seattle',
+    'Austin', 'Denver', 'Miami', 'Las Vegas', 'Washington DC', 'Atlanta',
+    'Portland', 'Phoenix', 'Dallas', 'Houston', 'Toronto', 'Vancouver',
+    'London', 'Berlin', 'Paris', 'Tokyo', 'Sydney'
+)
+_LOCATION_PATTERNS = [re.compile(p) for p in (
+    '(' + '|'.join(_KNOWN_CITIES) + ')',
+    r'[A-Z][a-z]+,\s*[A-Z]{2}',
+    r'[A-Z][a-z]+\s+[A-Z][a-z]+,\s*[A-Z]{2}'
+)]
+
+# Aho-Corasick automaton over the known cities, built once at import; stays
+# None (regex fallback) when pyahocorasick isn't installed
+if ahocorasick is not None:
+    _LOCATION_AC = ahocorasick.Automaton()
+    for _city in _KNOWN_CITIES:
+        _LOCATION_AC.add_word(_city, _city)
+    _LOCATION_AC.make_automaton()
+else:
+    _LOCATION_AC = None
+_DATE_LOCATION_RE = re.compile(r'(paris.*2025|september.*paris|november.*new york|june.*san francisco)')
+
+# Resource types the extraction pipeline never looks at - aborting them
+# cuts most of the landing page's bytes and load time
+_BLOCKED_RESOURCE_TYPES = {"image", "font", "media", "stylesheet"}
+
+# In-page event extractor mirroring the BeautifulSoup heuristics in
+# _extract_events_from_html. Runs where the DOM already lives, so the page
+# is never serialized over CDP and re-parsed in Python.
+_EXTRACT_EVENTS_JS = r"""
+() => {
+    const monthRe = /(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|January|February|March|April|June|July|August|September|October|November|December)\s+\d+[\s\-–]*(\d+)?,?\s*20\d{2}/i;
+    const datePatterns = [
+        /(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d+\s*[-–]\s*\d+,?\s*20\d{2}/i,
+        /(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d+\s*[-–]\s*\d+,?\s*20\d{2}/i,
+        /(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d+,?\s*20\d{2}/i,
+        /\d{1,2}\/\d{1,2}\/20\d{2}/,
+        /20\d{2}-\d{2}-\d{2}/
+    ];
+    // Mirrors _EVENT_DATE_PATTERNS: known event dates matched loosely in
+    // the lowered text and reported in canonical form (cross-month and
+    // month-only strings the generic patterns can't capture)
+    const eventDatePatterns = [
+        [/september\s+23[-–]24.*2025/, 'September 23-24, 2025'],
+        [/november\s+20[-–]22.*2025/, 'November 20-22, 2025'],
+        [/june\s+30.*july\s+2.*2026/, 'June 30-July 2, 2026'],
+        [/march.*2025/, 'March 2025']
+    ];
+    const excludeKeywords = [
+        'newsletter', 'email', 'spam', 'subscribe', 'join our', 'terms of service',
+        'code of conduct', 'sponsor inquiry', 'scholarships', 'contact us',
+        'copyright', '©', 'software 3.0', 'valuable insights', 'exclusive content',
+        'special offers', 'event updates', 'find more talks', 'watch our',
+        'what is an ai engineer', 'workshops'
+    ];
+    const eventKeywords = ['summit', 'conference', 'fair', 'workshop', 'meetup', 'hackathon'];
+    // Mirrors _LOCATION_PATTERNS: known cities first, then the generic
+    // "City, ST" forms
+    const locationPatterns = [
+        /(New York|San Francisco|Los Angeles|Chicago|Boston|Seattle|Austin|Denver|Miami|Las Vegas|Washington DC|Atlanta|Portland|Phoenix|Dallas|Houston|Toronto|Vancouver|London|Berlin|Paris|Tokyo|Sydney)/,
+        /[A-Z][a-z]+,\s*[A-Z]{2}/,
+        /[A-Z][a-z]+\s+[A-Z][a-z]+,\s*[A-Z]{2}/
+    ];
+
+    const events = [];
+    const seenTitles = new Set();
+
+    for (const el of document.querySelectorAll('div, article, section, li')) {
+        const text = (el.innerText || el.textContent || '');
+        const trimmed = text.trim();
+        if (trimmed.length < 30 || trimmed.length > 800) continue;
+        if (!/20\d{2}/.test(trimmed)) continue;
+
+        const lower = trimmed.toLowerCase();
+        if (excludeKeywords.some(k => lower.includes(k))) continue;
+
+        const hasDate = monthRe.test(trimmed);
+        const hasKeyword = eventKeywords.some(k => lower.includes(k));
+        if (!hasDate && !hasKeyword) continue;
+
+        // Title: headings, bold text, and links first, then any dated line
+        let title = null;
+        for (const h of el.querySelectorAll('h1,h2,h3,h4,h5,h6,strong,b,a')) {
+            const ht = (h.textContent || '').trim();
+            if (ht.length > 3 && ht.length < 100) {
+                const hl = ht.toLowerCase();
+                if (eventKeywords.some(k => hl.includes(k)) || hl.includes('aie paris')) {
+                    title = ht;
+                    break;
+                }
+            }
+        }
+        if (!title && hasDate) {
+            for (const line of trimmed.split('\n')) {
+                const s = line.trim();
+                if (/^(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d+/.test(s)) continue;
+                if (s.length > 10 && s.length < 100 && /20\d{2}/.test(s)) {
+                    title = s;
+                    break;
+                }
+            }
+        }
+        if (!title || seenTitles.has(title)) continue;
+        seenTitles.add(title);
+
+        let date = null;
+        for (const p of datePatterns) {
+            const m = trimmed.match(p);
+            if (m) { date = m[0].trim(); break; }
+        }
+        if (!date) {
+            for (const [p, std] of eventDatePatterns) {
+                if (p.test(lower)) { date = std; break; }
+            }
+        }
+
+        let location = null;
+        for (const p of locationPatterns) {
+            const m = trimmed.match(p);
+            if (m) { location = m[0].trim(); break; }
+        }
+
+        let description = null;
+        for (const p of el.querySelectorAll('p')) {
+            const pt = (p.textContent || '').trim();
+            if (pt.length > 30) {
+                description = pt.slice(0, 300) + (pt.length > 300 ? '...' : '');
+                break;
+            }
+        }
+        if (!description) {
+            const clean = trimmed.replace(/\s+/g, ' ');
+            description = clean.slice(0, 200) + (clean.length > 200 ? '...' : '');
+        }
+
+        let url = null;
+        for (const a of el.querySelectorAll('a[href]')) {
+            const href = a.getAttribute('href') || '';
+            if (href.includes('apply') || href.includes('register') || href.includes('event') || href.includes('ticket')) {
+                url = a.href;
+                break;
+            }
+        }
+
+        events.push({title, date, location, description, url});
+    }
+
+    return events;
+}
+"""
+
+# One Chromium process shared by every AIEngineerWebAutomation instance;
+# each workflow run gets its own cheap BrowserContext instead of paying
+# browser cold-start per run. The Playwright driver (a Node subprocess)
+# is likewise started once and shared.
+_PW_LOCK = asyncio.Lock()
+_BROWSER_LOCK = asyncio.Lock()
+_PLAYWRIGHT = None
+_BROWSER = None
+
+
+async def _get_playwright():
+    """Start the shared Playwright driver on first use"""
+    global _PLAYWRIGHT
+    async with _PW_LOCK:
+        if _PLAYWRIGHT is None:
+            _PLAYWRIGHT = await async_playwright().start()
+    return _PLAYWRIGHT
+
+
+async def _get_browser(headless=True, cdp_url=None):
+    """Launch the shared browser on first use and reuse it afterwards
+
+    When cdp_url (or the AIE_CDP_URL environment variable) is set, attach
+    to an already-running Chromium over CDP instead of launching a private
+    one, e.g. start it once with:
+
+        chromium --remote-debugging-port=9222
+
+    and point every agent at ws://localhost:9222/devtools/browser/<id>.
+    """
+    global _BROWSER
+    if cdp_url is None:
+        cdp_url = os.environ.get("AIE_CDP_URL")
+    async with _BROWSER_LOCK:
+        if _BROWSER is None:
+            playwright = await _get_playwright()
+            if cdp_url:
+                _BROWSER = await playwright.chromium.connect_over_cdp(cdp_url)
+            else:
+                _BROWSER = await playwright.chromium.launch(headless=headless)
+    return _BROWSER
+
+
+async def _stop_browser():
+    global _PLAYWRIGHT, _BROWSER
+    if _BROWSER is not None:
+        await _BROWSER.close()
+        _BROWSER = None
+    if _PLAYWRIGHT is not None:
+        await _PLAYWRIGHT.stop()
+        _PLAYWRIGHT = None
+
+
+def _shutdown_browser():
+    """Best-effort teardown of the shared browser at process exit"""
+    if _BROWSER is None:
+        return
+    try:
+        asyncio.run(_stop_browser())
+    except Exception:
+        pass
+
+
+atexit.register(_shutdown_browser)
+
 
 class AIEngineerWebAutomation:
     """Automate interactions with AI Engineer Summit website"""
-    
+
     def __init__(self):
         self.base_url = "https://www.ai.engineer/"
+        # Origin for resolving root-relative hrefs without a urljoin parse
+        self._base_origin = self.base_url.rstrip('/')
+        self.debug = os.environ.get("AIE_DEBUG") == "1"
         self.calendar_generator = AIEngineerCalendarGenerator()
         self.browser = None
+        self.context = None
         self.page = None
-    
-    async def start_browser(self, headless=True):
-        """Start the browser and create a new page"""
-        self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(headless=headless)
-        self.page = await self.browser.new_page()
-        
-        # Set user agent to appear more human-like
-        await self.page.set_extra_http_headers({
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        })
-    
+
+    async def start_browser(self, headless=True, cdp_url=None):
+        """Open a fresh context and page on the shared browser"""
+        self.browser = await _get_browser(headless=headless, cdp_url=cdp_url)
+        self.context = await self.browser.new_context(user_agent=USER_AGENT)
+
+        # Block images/fonts/media/styles before navigating - the workflow
+        # only reads the DOM and form elements, never the rendered pixels.
+        # Routing at the context level means popups and any extra pages
+        # inherit the filter too.
+        await self.context.route(
+            "**/*",
+            lambda route: route.abort()
+            if route.request.resource_type in _BLOCKED_RESOURCE_TYPES
+            else route.continue_()
+        )
+        self.page = await self.context.new_page()
+
     async def close_browser(self):
-        """Close the browser"""
-        if self.browser:
-            await self.browser.close()
-        if hasattr(self, 'playwright'):
-            await self.playwright.stop()
+        """Close this run's context; the shared browser stays warm"""
+        if self.context:
+            await self.context.close()
+            self.context = None
+            self.page = None
     
     async def navigate_to_site(self):
         """Navigate to the AI Engineer Summit website"""
         try:
             print(f"🌐 Navigating to {self.base_url}")
-            await self.page.goto(self.base_url, wait_until="networkidle")
-            
-            # Take a screenshot for debugging
-            await self.page.screenshot(path="ai_engineer_site.png")
-            print("📸 Screenshot saved as ai_engineer_site.png")
+            # domcontentloaded avoids waiting out analytics beacons the way
+            # networkidle does; callers that need specific elements wait for
+            # them explicitly
+            await self.page.goto(self.base_url, wait_until="domcontentloaded", timeout=15000)
             
+            if self.debug:
+                # Debug-only screenshot; JPEG skips the heavy PNG deflate pass
+                await self.page.screenshot(path="ai_engineer_site.jpg", type="jpeg", quality=60, full_page=False)
+                print("📸 Screenshot saved as ai_engineer_site.jpg")
+
             return True
         except Exception as e:
             print(f"❌ Error navigating to website: {e}")
             return False
     
+    def fetch_static_html(self):
+        """Fetch the landing page over plain HTTP with a conditional GET
+
+        ETag/Last-Modified validators are kept in ~/.cache so an unchanged
+        site answers 304 and the cached body is reused without re-downloading
+        (or starting a browser at all). Returns None when the fetch fails.
+        """
+        cache_dir = Path.home() / '.cache'
+        meta_file = cache_dir / 'ai_engineer_site.json'
+        body_file = cache_dir / 'ai_engineer_site.html'
+
+        headers = {'User-Agent': USER_AGENT}
+        try:
+            meta = json.loads(meta_file.read_text())
+        except (OSError, ValueError):
+            meta = {}
+
+        if body_file.exists():
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+
+        try:
+            response = requests.get(self.base_url, headers=headers, timeout=15)
+
+            if response.status_code == 304:
+                print("📦 Landing page unchanged - using cached HTML")
+                return body_file.read_text(encoding='utf-8')
+
+            response.raise_for_status()
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            body_file.write_text(response.text, encoding='utf-8')
+            meta_file.write_text(json.dumps({
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+            }))
+            return response.text
+
+        except Exception as e:
+            print(f"⚠️ Static fetch failed: {e}")
+            return None
+
     async def auto_signup_email(self, email):
         """Automatically fill and submit email signup form"""
         try:
             print(f"📧 Attempting to sign up with email: {email}")
-            
-            # Find email input field
-            email_input = await self.page.query_selector('input[type="email"]')
-            if not email_input:
-                # Try alternative selectors
-                email_input = await self.page.query_selector('input[placeholder*="email" i]')
-            
-            if email_input:
-                await email_input.fill(email)
-                print("✅ Email filled in form")
-                
-                # Find and click submit button
-                submit_button = await self.page.query_selector('button[type="submit"]')
-                if not submit_button:
-                    # Try to find any button near the email input
-                    submit_button = await self.page.query_selector('button')
-                
-                if submit_button:
-                    await submit_button.click()
-                    print("✅ Submit button clicked")
-                    
-                    # Wait for response
-                    await self.page.wait_for_timeout(2000)
-                    return True
-                else:
-                    print("❌ Could not find submit button")
-                    return False
-            else:
+
+            # Navigation returns at domcontentloaded, so wait for the form
+            # to actually render before probing - client-side forms appear
+            # after the initial HTML
+            await self.page.wait_for_selector(
+                'input[type="email"], input[placeholder*="email" i], input[name*="email" i]',
+                state="visible", timeout=5000)
+
+            # Probe for the field, fill it, and tag the submit button in one
+            # in-page evaluation - a single driver round-trip instead of one
+            # per fallback selector. The button is clicked separately so the
+            # POST listener below can be armed first.
+            status = await self.page.evaluate("""(email) => {
+                const input = document.querySelector('input[type="email"]')
+                    || document.querySelector('input[placeholder*="email" i]')
+                    || document.querySelector('input[name*="email" i]');
+                if (!input) return 'no_input';
+                input.value = email;
+                input.dispatchEvent(new Event('input', {bubbles: true}));
+                input.dispatchEvent(new Event('change', {bubbles: true}));
+                const button = (input.form && input.form.querySelector('button[type="submit"], button'))
+                    || document.querySelector('button[type="submit"]')
+                    || document.querySelector('form button')
+                    || document.querySelector('button');
+                if (!button) return 'no_button';
+                button.dataset.aieSubmit = '1';
+                return 'ok';
+            }""", email)
+
+            if status == 'no_input':
                 print("❌ Could not find email input field")
                 return False
-                
+            if status == 'no_button':
+                print("❌ Could not find submit button")
+                return False
+            print("✅ Email filled in form")
+
+            try:
+                # Wait for the form's POST to land rather than sleeping a
+                # fixed 2 seconds
+                async with self.page.expect_response(
+                    lambda r: r.request.method == "POST" and r.status < 500,
+                    timeout=10000
+                ):
+                    await self.page.evaluate(
+                        "() => document.querySelector('[data-aie-submit]').click()")
+                    print("✅ Submit button clicked")
+            except PlaywrightTimeoutError:
+                # SPA-style forms may not POST at all - fall back to a
+                # visible confirmation message
+                try:
+                    await self.page.wait_for_selector(
+                        "text=/thanks|subscribed|success/i", timeout=5000)
+                except PlaywrightTimeoutError:
+                    print("⚠️ No signup confirmation detected")
+            return True
+
         except Exception as e:
             print(f"❌ Error during email signup: {e}")
             return False
     
-    async def extract_multiple_events(self):
-        """Extract multiple event information from the website"""
-        import re
-        
+    async def extract_multiple_events(self, html=None):
+        """Extract multiple event information from the website
+
+        With a live page the classification runs inside Chromium, which
+        already holds the parsed DOM - no full-page HTML serialization or
+        re-parse in Python. Pass a static HTML string to parse without a
+        browser.
+        """
+        print("🔍 Extracting multiple events from website...")
+
+        if html is None and self.page is not None:
+            try:
+                events = await self.page.evaluate(_EXTRACT_EVENTS_JS)
+                print(f"📊 Found {len(events)} unique events: {[e.get('title', 'Untitled') for e in events]}")
+                return events
+            except Exception as e:
+                print(f"⚠️ In-page extraction failed ({e}), falling back to HTML parse")
+
+            try:
+                html = await self.page.content()
+            except Exception as e:
+                print(f"❌ Error extracting events: {e}")
+                return []
+
+        return self._extract_events_from_html(html)
+
+    def _extract_events_from_html(self, content):
+        """Extract events from a static HTML string with BeautifulSoup"""
         try:
-            print("🔍 Extracting multiple events from website...")
-            
-            # Get page content
-            content = await self.page.content()
-            soup = BeautifulSoup(content, 'html.parser')
-            
+            # lxml's C parser is several times faster than the pure-Python
+            # html.parser on a full landing page; fall back when it isn't
+            # installed since it is an optional requirement
+            try:
+                soup = BeautifulSoup(content, 'lxml')
+            except FeatureNotFound:
+                soup = BeautifulSoup(content, 'html.parser')
+
             events = []
-            
-            # Look for event containers - common patterns
-            event_containers = []
-            
-            # Try various selectors for event containers
-            container_selectors = [
-                '[class*="event"]',
-                '[class*="events"]',
-                '[class*="upcoming"]',
-                '[class*="conference"]', 
-                '[class*="summit"]',
-                '[class*="card"]',
-                'article',
-                'section',
-                'li',
-                'div',
-                '.event-item',
-                '.conference-item'
-            ]
-            
-            # Look for event cards/containers with specific patterns
-            # Target event-specific containers first
+
+            # get_text() walks the whole subtree and is the most expensive
+            # BS4 call here, so materialize each container's text exactly once
+            # and share it between the walk below and _extract_single_event
+            text_cache = {}
+
+            def _cached_text(el):
+                key = id(el)
+                cached = text_cache.get(key)
+                if cached is None:
+                    cached = el.get_text()
+                    text_cache[key] = cached
+                return cached
+
+            # One walk over the tree replaces the old find_all() pass plus a
+            # dozen soup.select() passes, each of which re-traversed the whole
+            # document.  Event-specific containers keep priority by going into
+            # their own list; id()-based dedup happens inline.
             event_specific_containers = []
-            
-            # Look for containers that likely contain individual events
-            potential_events = soup.find_all(['div', 'article', 'section'])
-            
-            for container in potential_events:
-                container_text = container.get_text()
+            general_containers = []
+            seen = set()
+
+            body = soup.body or soup
+            for el in body.descendants:
+                if not isinstance(el, Tag):
+                    continue
+
+                name = el.name
+                is_generic = name in ('div', 'article', 'section', 'li')
+                if not is_generic:
+                    # Same class-substring match the old [class*=...] selectors did
+                    classes = el.get('class')
+                    if not classes:
+                        continue
+                    class_str = ' '.join(classes).lower()
+                    if not any(k in class_str for k in ('event', 'upcoming', 'conference', 'summit', 'card')):
+                        continue
+
+                container_text = _cached_text(el)
                 if not container_text:
                     continue
-                    
-                # Check if this container has event indicators
                 container_lower = container_text.lower()
-                has_event_title = any(keyword in container_lower for keyword in 
-                    ['aie paris', 'fall summit', 'world\'s fair', 'ai engineer summit', 'ai engineer world', 'paris 2025'])
-                
-                # Look for specific event patterns including dates
-                has_date_location = bool(re.search(r'(paris.*2025|september.*paris|november.*new york|june.*san francisco)', container_lower))
-                
-                # Size filter - should be substantial but not the whole page
-                text_length = len(container_text.strip())
-                is_reasonable_size = 30 < text_length < 800
-                
-                # Must contain year indicator for events
-                has_year = bool(re.search(r'20\d{2}', container_text))
-                
-                if (has_event_title or has_date_location) and is_reasonable_size and has_year:
-                    event_specific_containers.append(container)
-                    # print(f"🎯 Found potential event container: {container_text[:80].replace(chr(10), ' ')}...")
-            
-            # Add these specific containers first
-            event_containers.extend(event_specific_containers)
-            
-            # Also scan with regular selectors for comprehensive coverage
-            for selector in container_selectors:
-                containers = soup.select(selector)
-                for container in containers:
-                    container_text = container.get_text().lower()
-                    # Check if this container likely contains event info
-                    if any(keyword in container_text for keyword in ['2025', '2026', 'summit', 'conference', 'event', 'workshop', 'meetup', 'hackathon']):
-                        event_containers.append(container)
-            
-            # Remove duplicates while preserving order
-            seen = set()
-            unique_containers = []
-            for container in event_containers:
-                container_id = id(container)
-                if container_id not in seen:
-                    seen.add(container_id)
-                    unique_containers.append(container)
-            event_containers = unique_containers
-            
+
+                if name in ('div', 'article', 'section'):
+                    # Check if this container has event indicators
+                    has_event_title = bool(_CONTAINER_TITLE_RE.search(container_lower))
+
+                    # Look for specific event patterns including dates
+                    has_date_location = bool(_DATE_LOCATION_RE.search(container_lower))
+
+                    # Size filter - should be substantial but not the whole page
+                    text_length = len(container_lower.strip())
+                    is_reasonable_size = 30 < text_length < 800
+
+                    # Must contain year indicator for events
+                    has_year = bool(_YEAR_RE.search(container_lower))
+
+                    if (has_event_title or has_date_location) and is_reasonable_size and has_year:
+                        event_specific_containers.append(el)
+                        seen.add(id(el))
+                        continue
+
+                # Size-gate here with the text already in hand so page-sized
+                # wrappers and near-empty nodes never reach
+                # _extract_single_event (which would reject them anyway,
+                # after being called)
+                if len(container_text) > 2000 or len(container_text.strip()) < 10:
+                    continue
+
+                # Check if this container likely contains event info
+                if id(el) not in seen and _CONTAINER_KW_RE.search(container_lower) is not None:
+                    seen.add(id(el))
+                    general_containers.append(el)
+
+            # Specific containers first, then the general matches
+            event_containers = event_specific_containers + general_containers
+
             print(f"🔍 Found {len(event_containers)} potential event containers")
             
             # If no specific containers found, scan the entire page for event patterns
             if not event_containers:
                 event_containers = [soup.body] if soup.body else [soup]
             
+            seen_titles = set()
             for i, container in enumerate(event_containers):
-                event_info = self._extract_single_event(container)
+                event_info = self._extract_single_event(container, text_cache.get(id(container)))
                 # print(f"🔍 Container {i+1}: {container.name if hasattr(container, 'name') else 'unknown'} - {event_info.get('title') if event_info else 'No title found'}")
-                
+
                 if event_info and event_info.get('title'):
                     # Avoid duplicates
-                    if not any(e.get('title') == event_info.get('title') for e in events):
+                    title = event_info['title']
+                    if title not in seen_titles:
+                        seen_titles.add(title)
                         events.append(event_info)
                         # print(f"✅ Added event: {event_info.get('title')}")
             
@@ -223,11 +626,14 @@ class AIEngineerWebAutomation:
             print(f"❌ Error extracting events: {e}")
             return []
     
-    def _extract_single_event(self, container):
-        """Extract event information from a container element"""
-        import re
-        
-        text = container.get_text()
+    def _extract_single_event(self, container, text=None):
+        """Extract event information from a container element
+
+        The caller may forward the container's already-materialized text to
+        avoid a second full-subtree get_text() walk.
+        """
+        if text is None:
+            text = container.get_text()
         event_info = {
             'title': None,
             'date': None,
@@ -239,43 +645,30 @@ class AIEngineerWebAutomation:
         # Skip containers that are too large (likely page containers)
         if len(text) > 2000:
             return None
-            
+
+        # Strip once up front; every later whole-string pass reuses this
+        text_stripped = text.strip()
+
         # Skip containers with very little text
-        if len(text.strip()) < 10:
+        if len(text_stripped) < 10:
             return None
         
         # Skip non-event content by checking for exclusion patterns
         text_lower = text.lower()
-        exclude_patterns = [
-            'newsletter', 'email', 'spam', 'subscribe', 'join our', 'terms of service', 
-            'code of conduct', 'sponsor inquiry', 'scholarships', 'contact us', 
-            'copyright', '©', 'software 3.0', 'valuable insights', 'exclusive content',
-            'special offers', 'event updates', 'find more talks', 'watch our',
-            'what is an ai engineer', 'workshops'
-        ]
-        
-        if any(exclude in text_lower for exclude in exclude_patterns):
+        if _EXCLUDE_RE.search(text_lower) is not None:
             return None
         
         # Skip if the text looks like just a date string
-        date_only_patterns = [
-            r'^(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d+[-–]\d+\s+20\d{2},?\s*[A-Za-z\s,]+$',
-            r'^(June|November|September)\s+\d+[-–](July\s+)?\d+\s+20\d{2},?\s*[A-Za-z\s,]+$'
-        ]
-        
-        for pattern in date_only_patterns:
-            if re.match(pattern, text.strip()):
-                print(f"🚫 Skipping date-only string: {text.strip()[:50]}")
+        for pattern in _DATE_ONLY_RES:
+            if pattern.match(text_stripped):
+                print(f"🚫 Skipping date-only string: {text_stripped[:50]}")
                 return None
         
-        # Must contain either a date pattern OR event-related keywords to be considered
-        has_date = False
-        if text and isinstance(text, str):
-            has_date = bool(re.search(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|January|February|March|April|May|June|July|August|September|October|November|December)\s+\d+[\s\-–]*(\d+)?,?\s*20\d{2}', text, re.IGNORECASE))
-        
-        has_event_keywords = any(keyword in text_lower for keyword in ['summit', 'conference', 'fair', 'workshop', 'meetup', 'hackathon'])
-        
-        if not (has_date or has_event_keywords):
+        # Must contain either a date pattern OR event-related keywords to be
+        # considered - one alternation scan replaces six substring walks, and
+        # it only runs at all when no date was found
+        has_date = bool(text) and bool(_ANY_DATE_RE.search(text))
+        if not has_date and _EVENT_KW_RE.search(text_lower) is None:
             return None
         
         # Extract title - look for headings first, then strong text, then meaningful text
@@ -304,37 +697,25 @@ class AIEngineerWebAutomation:
         
         # Use the most relevant title with broader keyword matching
         for title in title_candidates:
-            title_lower = title.lower()
             # Accept specific AI Engineer event patterns
-            if any(keyword in title_lower for keyword in ['summit', 'conference', 'fair', 'workshop', 'meetup', 'hackathon', 'aie paris']):
+            if _TITLE_KW_RE.search(title.lower()):
                 event_info['title'] = title
                 break
         
         # If no good title found and we have dates, try to find a meaningful title
         if not event_info['title'] and has_date:
-            lines = text.strip().split('\n') if text else []
-            for line in lines:
+            for line in text_stripped.split('\n'):
                 line = line.strip()
                 # Skip lines that look like pure date strings
-                if re.match(r'^(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d+', line):
+                if _MONTH_LINE_RE.match(line):
                     continue
-                if len(line) > 10 and len(line) < 100 and re.search(r'20\d{2}', line):
+                if len(line) > 10 and len(line) < 100 and _YEAR_RE.search(line):
                     event_info['title'] = line
                     break
         
-        # Extract dates - look for various date formats including those in titles
-        date_patterns = [
-            r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d+\s*[-–]\s*\d+,?\s*20\d{2}',
-            r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d+\s*[-–]\s*\d+,?\s*20\d{2}',
-            r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d+,?\s*20\d{2}',
-            r'(September|November|June)\s+\d+[-–]\d+,?\s*20\d{2}',
-            r'\d{1,2}/\d{1,2}/20\d{2}',
-            r'20\d{2}-\d{2}-\d{2}'
-        ]
-        
         # First, look for date info in the entire container text
-        for pattern in date_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _DATE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 event_info['date'] = match.group().strip()
                 print(f"🗓️ Found date in text: {event_info['date']}")
@@ -343,8 +724,8 @@ class AIEngineerWebAutomation:
         # Also check the title if we have one
         title_text = event_info.get('title') or ''
         if title_text and not event_info['date']:
-            for pattern in date_patterns:
-                match = re.search(pattern, title_text, re.IGNORECASE)
+            for pattern in _DATE_PATTERNS:
+                match = pattern.search(title_text)
                 if match:
                     event_info['date'] = match.group().strip()
                     print(f"🗓️ Found date in title: {event_info['date']}")
@@ -352,43 +733,35 @@ class AIEngineerWebAutomation:
         
         # Look for specific event date patterns
         if not event_info['date']:
-            # Check for specific patterns in the text
-            event_date_patterns = [
-                (r'september\s+23[-–]24.*2025', 'September 23-24, 2025'),
-                (r'november\s+20[-–]22.*2025', 'November 20-22, 2025'),
-                (r'june\s+30.*july\s+2.*2026', 'June 30-July 2, 2026'),
-                (r'march.*2025', 'March 2025')
-            ]
-            
-            for pattern, standard_date in event_date_patterns:
-                if re.search(pattern, text.lower()):
+            for pattern, standard_date in _EVENT_DATE_PATTERNS:
+                if pattern.search(text_lower):
                     event_info['date'] = standard_date
                     print(f"🗓️ Found specific event date: {standard_date}")
                     break
         
-        # Extract location
-        location_patterns = [
-            r'(New York|San Francisco|Los Angeles|Chicago|Boston|Seattle|Austin|Denver|Miami|Las Vegas|Washington DC|Atlanta|Portland|Phoenix|Dallas|Houston|Toronto|Vancouver|London|Berlin|Paris|Tokyo|Sydney)',
-            r'[A-Z][a-z]+,\s*[A-Z]{2}',
-            r'[A-Z][a-z]+\s+[A-Z][a-z]+,\s*[A-Z]{2}'
-        ]
-        
-        for pattern in location_patterns:
-            match = re.search(pattern, text)
-            if match:
-                event_info['location'] = match.group().strip()
+        # Extract location - known city names via the automaton when
+        # available, otherwise fall through to the compiled patterns
+        if _LOCATION_AC is not None:
+            for _, city in _LOCATION_AC.iter(text):
+                event_info['location'] = city
                 break
+        if not event_info['location']:
+            for pattern in _LOCATION_PATTERNS:
+                match = pattern.search(text)
+                if match:
+                    event_info['location'] = match.group().strip()
+                    break
         
-        # Extract description - find meaningful paragraphs
-        paragraphs = container.find_all('p')
-        for p in paragraphs:
-            p_text = p.get_text().strip()
+        # Extract description - find meaningful paragraphs; the limit keeps
+        # pathological containers from walking hundreds of subtrees
+        for p in container.find_all('p', limit=50):
+            p_text = p.get_text(' ', strip=True)
             if len(p_text) > 30:
                 event_info['description'] = p_text[:300] + ('...' if len(p_text) > 300 else '')
                 break
         
         # If no paragraph description, use container text but limit it
-        if not event_info['description'] and len(text.strip()) > 30:
+        if not event_info['description'] and len(text_stripped) > 30:
             clean_text = ' '.join(text.split())  # Remove extra whitespace
             event_info['description'] = clean_text[:200] + ('...' if len(clean_text) > 200 else '')
         
@@ -398,6 +771,10 @@ class AIEngineerWebAutomation:
             if href and ('apply' in href or 'register' in href or 'event' in href or 'ticket' in href):
                 if href.startswith('http'):
                     event_info['url'] = href
+                elif href.startswith('/'):
+                    # Root-relative is the common case; skip urljoin's
+                    # double urlparse and concatenate onto the origin
+                    event_info['url'] = self._base_origin + href
                 else:
                     event_info['url'] = urljoin(self.base_url, href)
                 break
@@ -460,28 +837,31 @@ class AIEngineerWebAutomation:
         """Open external forms in new tabs"""
         try:
             print("🔗 Looking for external form links...")
-            
-            # Get all links
-            links = await self.page.query_selector_all('a')
-            
-            external_links = {}
-            for link in links:
-                href = await link.get_attribute('href')
-                text = await link.text_content()
-                
-                if href:
-                    if 'forms.gle' in href:
-                        external_links['speaker_form'] = href
-                        print(f"🎤 Found speaker application: {href}")
-                    elif 'docs.google.com/forms' in href:
-                        external_links['volunteer_form'] = href
-                        print(f"🙋 Found volunteer form: {href}")
-                    elif 'mailto:' in href:
-                        external_links['sponsor_email'] = href
-                        print(f"📧 Found sponsor email: {href}")
-            
+
+            # Classify every link inside the browser in one evaluate call
+            # instead of two CDP round-trips per <a>
+            external_links = await self.page.evaluate("""
+                () => {
+                    const out = {};
+                    for (const a of document.querySelectorAll('a[href]')) {
+                        const h = a.href;
+                        if (h.includes('forms.gle')) out.speaker_form = h;
+                        else if (h.includes('docs.google.com/forms')) out.volunteer_form = h;
+                        else if (h.startsWith('mailto:')) out.sponsor_email = h;
+                    }
+                    return out;
+                }
+            """)
+
+            if 'speaker_form' in external_links:
+                print(f"🎤 Found speaker application: {external_links['speaker_form']}")
+            if 'volunteer_form' in external_links:
+                print(f"🙋 Found volunteer form: {external_links['volunteer_form']}")
+            if 'sponsor_email' in external_links:
+                print(f"📧 Found sponsor email: {external_links['sponsor_email']}")
+
             return external_links
-            
+
         except Exception as e:
             print(f"❌ Error finding external forms: {e}")
             return {}
@@ -490,20 +870,32 @@ class AIEngineerWebAutomation:
         """Run the complete automated workflow"""
         print("🤖 Starting AI Engineer Website Automation")
         print("=" * 50)
-        
-        # Navigate to website
-        if not await self.navigate_to_site():
-            return False
-        
-        # Extract multiple events from the website
-        events = await self.extract_multiple_events()
-        
-        # Auto signup email if provided
-        if email:
-            await self.auto_signup_email(email)
-        
-        # Find external forms
-        external_links = await self.open_external_forms()
+
+        external_links = {}
+
+        if email is None and self.page is None:
+            # Extract-only run with no browser started: a conditional GET of
+            # the landing page is enough, skipping Chromium entirely
+            html = self.fetch_static_html()
+            if html is None:
+                return False
+            events = await self.extract_multiple_events(html=html)
+        else:
+            # Navigate to website
+            if not await self.navigate_to_site():
+                return False
+
+            # Event extraction and form discovery are both read-only against
+            # the loaded page, so their round-trips can interleave; email
+            # signup runs afterwards because it mutates page state
+            events, external_links = await asyncio.gather(
+                self.extract_multiple_events(),
+                self.open_external_forms(),
+            )
+
+            # Auto signup email if provided
+            if email:
+                await self.auto_signup_email(email)
         
         # Generate calendar events if requested
         calendar_files = []
@@ -512,8 +904,32 @@ class AIEngineerWebAutomation:
             selected_events = self.select_events_interactive(events)
             
             if selected_events:
-                print("\n📅 Generating calendar files...")
-                calendar_files = self.calendar_generator.save_multiple_calendar_files(selected_events)
+                # Skip regeneration when the same events already produced
+                # .ics files - the hash sidecar records what was rendered
+                sidecar = Path('ai_engineer_calendar.hash')
+                digest = hashlib.blake2b(
+                    json.dumps(selected_events, sort_keys=True, default=str).encode(),
+                    digest_size=16).hexdigest()
+
+                cached = None
+                try:
+                    cached = json.loads(sidecar.read_text())
+                except (OSError, ValueError):
+                    pass
+
+                if (cached and cached.get('hash') == digest
+                        and cached.get('files')
+                        and all(Path(f).exists() for f in cached['files'])):
+                    calendar_files = [Path(f) for f in cached['files']]
+                    print(f"\n📅 Events unchanged - reusing {len(calendar_files)} cached calendar files")
+                else:
+                    print("\n📅 Generating calendar files...")
+                    # Render and write the .ics files off the event loop so
+                    # the Playwright connection keeps making progress
+                    calendar_files = await asyncio.to_thread(
+                        self.calendar_generator.save_multiple_calendar_files, selected_events)
+                    sidecar.write_text(json.dumps(
+                        {'hash': digest, 'files': [str(f) for f in calendar_files]}))
         
         # Save automation results
         results = {
@@ -527,40 +943,90 @@ class AIEngineerWebAutomation:
             'calendar_files': [str(f) for f in calendar_files]
         }
         
-        # Save results to JSON file
+        # Save results to JSON file - write to a temp file and replace
+        # atomically so a crash can't leave a truncated results file.
+        # orjson serializes in C when available; the stdlib fallback keeps
+        # ensure_ascii=False to skip the escape pass over non-ASCII text
         results_file = Path('automation_results.json')
-        with open(results_file, 'w') as f:
-            json.dump(results, f, indent=2)
-        
+        tmp_file = results_file.with_suffix('.json.tmp')
+        if orjson is not None:
+            tmp_file.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_file, results_file)
+
         print(f"\n📊 Automation results saved to: {results_file}")
         return True
 
+    async def run_batch(self, emails, headless=True, generate_calendar=False):
+        """Run the signup workflow for several emails in parallel
+
+        Each email gets its own BrowserContext on the shared Chromium -
+        contexts are orders of magnitude cheaper than extra browsers - and
+        the workflows run concurrently under asyncio.gather. Calendar
+        generation defaults off because its selection prompt is interactive.
+        """
+        async def _one(email):
+            automation = AIEngineerWebAutomation()
+            await automation.start_browser(headless=headless)
+            try:
+                return await automation.automated_workflow(
+                    email=email, generate_calendar=generate_calendar)
+            finally:
+                await automation.close_browser()
+
+        return await asyncio.gather(*(_one(email) for email in emails))
+
 
 async def interactive_mode():
     """Run the automation in interactive mode"""
     automation = AIEngineerWebAutomation()
-    
+    loop = asyncio.get_running_loop()
+
+    def _ask(prompt):
+        # Run blocking input() in a worker thread so background tasks (the
+        # browser launch below) keep making progress while the user types
+        return loop.run_in_executor(None, input, prompt)
+
     try:
         print("🚀 AI Engineer Website Automation Tool")
         print("=" * 50)
-        
+
         # Ask user for preferences
-        email = input("Enter your email for signup (or press Enter to skip): ").strip()
-        if not email:
-            email = None
-        
-        headless_choice = input("Run browser in headless mode? (y/n): ").lower().strip()
+        email_answer = (await _ask("Enter email(s) for signup, comma-separated (or press Enter to skip): ")).strip()
+        emails = [e.strip() for e in email_answer.split(',') if e.strip()]
+
+        headless_choice = (await _ask("Run browser in headless mode? (y/n): ")).lower().strip()
         headless = headless_choice not in ['n', 'no']
-        
-        calendar_choice = input("Generate calendar event? (y/n): ").lower().strip()
-        generate_calendar = calendar_choice not in ['n', 'no']
-        
-        # Start automation
-        await automation.start_browser(headless=headless)
-        success = await automation.automated_workflow(
-            email=email,
-            generate_calendar=generate_calendar
-        )
+
+        # Launch the browser while the user answers the remaining prompt -
+        # by the time they hit Enter it is usually ready. With no email
+        # there is nothing to submit, so skip the launch and let
+        # automated_workflow take the browser-free conditional-GET path
+        browser_task = None
+        if len(emails) == 1:
+            browser_task = asyncio.create_task(automation.start_browser(headless=headless))
+
+        if len(emails) > 1:
+            # Calendar generation needs the interactive selection prompt,
+            # which doesn't mix with parallel runs - say so instead of
+            # asking and ignoring the answer
+            print("📅 Calendar generation is unavailable in batch mode - skipping")
+            # Fan the signups out across parallel contexts on one browser
+            results = await automation.run_batch(emails, headless=headless)
+            success = all(results)
+        else:
+            calendar_choice = (await _ask("Generate calendar event? (y/n): ")).lower().strip()
+            generate_calendar = calendar_choice not in ['n', 'no']
+
+            # Start automation
+            if browser_task is not None:
+                await browser_task
+            success = await automation.automated_workflow(
+                email=emails[0] if emails else None,
+                generate_calendar=generate_calendar
+            )
         
         if success:
             print("\n🎉 Automation completed successfully!")